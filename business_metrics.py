@@ -8,73 +8,130 @@ and customer experience indicators.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, NamedTuple
 import plotly.express as px
 import plotly.graph_objects as go
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; cohort analysis falls back to pandas
+    njit = None
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional; compute_all_metrics_polars falls back to pandas
+    pl = None
+
+# Delivery-day upper bounds (inclusive) and the operational score for each band;
+# np.searchsorted maps scalars or arrays of average delivery days to a band
+OPERATIONAL_SCORE_BREAKS = np.array([5, 10, 15])
+OPERATIONAL_SCORE_VALUES = np.array([90, 80, 70, 50])
+
+# Measure columns are stored as float32 to halve their memory; analyzers
+# aggregate them in float64 so reported totals keep cent precision
+REPORTING_DTYPES = {'total_revenue': 'float64', 'price': 'float64'}
+
+
+def with_reporting_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Upcast the float32 measure columns to float64 for aggregation.
+    
+    Args:
+        df: Sales dataset
+        
+    Returns:
+        DataFrame whose measure columns are float64 (other columns are shared)
+    """
+    return df.astype({column: dtype for column, dtype in REPORTING_DTYPES.items() if column in df.columns})
+
 
 def calculate_revenue_metrics(df: pd.DataFrame, 
-                            comparison_df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+                            comparison_df: Optional[pd.DataFrame] = None,
+                            comparison_metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Calculate comprehensive revenue metrics for the given dataset.
     
     Args:
         df: Primary dataset for analysis
         comparison_df: Optional comparison dataset (e.g., previous period)
+        comparison_metrics: Precomputed calculate_revenue_metrics(comparison_df) result (optional)
         
     Returns:
         Dictionary containing revenue metrics and growth rates
     """
     metrics = {}
+    df = with_reporting_dtypes(df)
+    
+    # Per-order revenue, computed once and reused for all order-level stats
+    order_values = df.groupby('order_id', sort=False, observed=True)['total_revenue'].sum()
     
     # Basic revenue metrics
     metrics['total_revenue'] = df['total_revenue'].sum()
-    metrics['total_orders'] = df['order_id'].nunique()
+    metrics['total_orders'] = order_values.size
     metrics['total_items_sold'] = len(df)
-    metrics['average_order_value'] = df.groupby('order_id')['total_revenue'].sum().mean()
+    metrics['average_order_value'] = order_values.mean()
     metrics['average_item_price'] = df['price'].mean()
     
     # Revenue distribution
-    order_values = df.groupby('order_id')['total_revenue'].sum()
     metrics['median_order_value'] = order_values.median()
     metrics['revenue_std'] = order_values.std()
     
     # Calculate growth rates if comparison data provided
-    if comparison_df is not None:
-        comp_metrics = calculate_revenue_metrics(comparison_df)
-        
-        # Revenue growth rate (handle zero division)
-        if comp_metrics['total_revenue'] > 0:
-            metrics['revenue_growth_rate'] = (
-                (metrics['total_revenue'] - comp_metrics['total_revenue']) / 
-                comp_metrics['total_revenue']
-            )
-        else:
-            metrics['revenue_growth_rate'] = 0.0
-            
-        # Order growth rate (handle zero division)
-        if comp_metrics['total_orders'] > 0:
-            metrics['order_growth_rate'] = (
-                (metrics['total_orders'] - comp_metrics['total_orders']) / 
-                comp_metrics['total_orders']
-            )
-        else:
-            metrics['order_growth_rate'] = 0.0
-            
-        # AOV growth rate (handle zero division)
-        if comp_metrics['average_order_value'] > 0:
-            metrics['aov_growth_rate'] = (
-                (metrics['average_order_value'] - comp_metrics['average_order_value']) / 
-                comp_metrics['average_order_value']
-            )
-        else:
-            metrics['aov_growth_rate'] = 0.0
+    if comparison_metrics is None and comparison_df is not None:
+        comparison_metrics = calculate_revenue_metrics(comparison_df)
+    
+    if comparison_metrics is not None:
+        metrics.update(calculate_growth_rates(metrics, comparison_metrics))
     
     return metrics
 
 
+def calculate_growth_rates(metrics: Dict[str, Any],
+                           comparison_metrics: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Calculate revenue, order and AOV growth rates against a comparison period.
+    
+    Args:
+        metrics: Revenue metrics for the primary period
+        comparison_metrics: Revenue metrics for the comparison period
+        
+    Returns:
+        Dictionary containing revenue, order and AOV growth rates
+    """
+    growth_rates = {}
+    
+    # Revenue growth rate (handle zero division)
+    if comparison_metrics['total_revenue'] > 0:
+        growth_rates['revenue_growth_rate'] = (
+            (metrics['total_revenue'] - comparison_metrics['total_revenue']) / 
+            comparison_metrics['total_revenue']
+        )
+    else:
+        growth_rates['revenue_growth_rate'] = 0.0
+        
+    # Order growth rate (handle zero division)
+    if comparison_metrics['total_orders'] > 0:
+        growth_rates['order_growth_rate'] = (
+            (metrics['total_orders'] - comparison_metrics['total_orders']) / 
+            comparison_metrics['total_orders']
+        )
+    else:
+        growth_rates['order_growth_rate'] = 0.0
+        
+    # AOV growth rate (handle zero division)
+    if comparison_metrics['average_order_value'] > 0:
+        growth_rates['aov_growth_rate'] = (
+            (metrics['average_order_value'] - comparison_metrics['average_order_value']) / 
+            comparison_metrics['average_order_value']
+        )
+    else:
+        growth_rates['aov_growth_rate'] = 0.0
+    
+    return growth_rates
+
+
 def calculate_monthly_trends(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate month-over-month growth trends and seasonal patterns.
@@ -85,24 +142,34 @@ def calculate_monthly_trends(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with monthly metrics and growth rates
     """
-    # Monthly revenue aggregation
-    monthly_data = df.groupby(['year', 'month']).agg({
-        'total_revenue': 'sum',
-        'order_id': 'nunique',
-        'order_item_id': 'count'
-    }).reset_index()
-    
-    # Rename columns for clarity
-    monthly_data.columns = ['year', 'month', 'revenue', 'orders', 'items_sold']
-    
-    # Calculate month-over-month growth rates
-    monthly_data = monthly_data.sort_values(['year', 'month'])
-    monthly_data['revenue_mom_growth'] = monthly_data['revenue'].pct_change()
-    monthly_data['orders_mom_growth'] = monthly_data['orders'].pct_change()
+    # Monthly revenue aggregation (groupby sorts by year and month; input
+    # already in purchase order keeps each month's rows contiguous)
+    monthly_data = with_reporting_dtypes(df).groupby(['year', 'month'], sort=True, observed=True).agg(
+        revenue=('total_revenue', 'sum'),
+        orders=('order_id', 'nunique'),
+        items_sold=('order_item_id', 'count')
+    ).reset_index()
+    
+    return add_monthly_growth_rates(monthly_data)
+
+
+def add_monthly_growth_rates(monthly_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add average order value and month-over-month growth rates to monthly totals.
     
+    Args:
+        monthly_data: Monthly revenue, orders and items sold, sorted by month
+        
+    Returns:
+        DataFrame with monthly metrics and growth rates
+    """
     # Calculate average order value
     monthly_data['avg_order_value'] = monthly_data['revenue'] / monthly_data['orders']
-    monthly_data['aov_mom_growth'] = monthly_data['avg_order_value'].pct_change()
+    
+    # Calculate month-over-month growth rates
+    monthly_data[['revenue_mom_growth', 'orders_mom_growth', 'aov_mom_growth']] = (
+        monthly_data[['revenue', 'orders', 'avg_order_value']].pct_change()
+    )
     
     return monthly_data
 
@@ -119,30 +186,29 @@ def analyze_product_performance(df: pd.DataFrame, top_n: int = 10) -> Dict[str,
         Dictionary containing various product performance metrics
     """
     results = {}
+    df = with_reporting_dtypes(df)
     
-    # Revenue by product category
-    category_revenue = df.groupby('product_category_name').agg({
-        'total_revenue': 'sum',
-        'order_id': 'nunique',
-        'order_item_id': 'count',
-        'price': 'mean'
-    }).reset_index()
+    # Single grouper shared by the revenue and items-per-order aggregations
+    category_groups = df.groupby('product_category_name', sort=False, observed=True)
     
-    category_revenue.columns = ['category', 'total_revenue', 'unique_orders', 'items_sold', 'avg_price']
-    category_revenue = category_revenue.sort_values('total_revenue', ascending=False)
+    # Revenue by product category (kept indexed; flattened only for the top-N results)
+    category_revenue = category_groups.agg(
+        total_revenue=('total_revenue', 'sum'),
+        unique_orders=('order_id', 'nunique'),
+        items_sold=('order_item_id', 'count'),
+        avg_price=('price', 'mean')
+    ).rename_axis('category')
     
-    results['category_performance'] = category_revenue.head(top_n)
+    results['category_performance'] = category_revenue.nlargest(top_n, 'total_revenue').reset_index()
     
     # Product category market share
     total_revenue = df['total_revenue'].sum()
-    category_revenue['market_share'] = category_revenue['total_revenue'] / total_revenue
-    results['market_share'] = category_revenue[['category', 'market_share']].head(top_n)
+    market_share = (category_revenue['total_revenue'] / total_revenue).rename('market_share')
+    results['market_share'] = market_share.nlargest(top_n).reset_index()
     
     # Items per order by category
-    category_metrics = df.groupby(['order_id', 'product_category_name']).size().reset_index(name='items_per_order')
-    avg_items_per_order = category_metrics.groupby('product_category_name')['items_per_order'].mean().reset_index()
-    avg_items_per_order = avg_items_per_order.sort_values('items_per_order', ascending=False)
-    results['items_per_order'] = avg_items_per_order.head(top_n)
+    avg_items_per_order = category_groups['order_item_id'].count() / category_groups['order_id'].nunique()
+    results['items_per_order'] = avg_items_per_order.nlargest(top_n).reset_index(name='items_per_order')
     
     return results
 
@@ -161,27 +227,24 @@ def analyze_geographic_performance(df: pd.DataFrame, top_n: int = 10) -> Dict[st
     results = {}
     
     # State-level analysis
-    state_performance = df.groupby('customer_state').agg({
-        'total_revenue': 'sum',
-        'order_id': 'nunique',
-        'customer_id': 'nunique',
-        'price': 'mean'
-    }).reset_index()
-    
-    state_performance.columns = ['state', 'total_revenue', 'total_orders', 'unique_customers', 'avg_item_price']
-    state_performance = state_performance.sort_values('total_revenue', ascending=False)
+    state_performance = with_reporting_dtypes(df).groupby('customer_state', sort=False, observed=True).agg(
+        total_revenue=('total_revenue', 'sum'),
+        total_orders=('order_id', 'nunique'),
+        unique_customers=('customer_id', 'nunique'),
+        avg_item_price=('price', 'mean')
+    ).rename_axis('state')
     
     # Calculate revenue per customer by state
     state_performance['revenue_per_customer'] = (
         state_performance['total_revenue'] / state_performance['unique_customers']
     )
     
-    results['state_performance'] = state_performance.head(top_n)
+    results['state_performance'] = state_performance.nlargest(top_n, 'total_revenue').reset_index()
     
     # Top states by customer count
     results['top_customer_states'] = state_performance.nlargest(top_n, 'unique_customers')[
-        ['state', 'unique_customers', 'total_revenue']
-    ]
+        ['unique_customers', 'total_revenue']
+    ].reset_index()
     
     return results
 
@@ -202,13 +265,15 @@ def analyze_customer_experience(df: pd.DataFrame) -> Dict[str, Any]:
     if 'review_score' in df.columns:
         review_data = df.dropna(subset=['review_score'])
         if len(review_data) > 0:
+            score_counts = review_data['review_score'].value_counts()
+            total_reviews = int(score_counts.sum())
+            
             metrics['avg_review_score'] = review_data['review_score'].mean()
-            metrics['review_score_distribution'] = review_data['review_score'].value_counts(normalize=True)
+            metrics['review_score_distribution'] = (score_counts / total_reviews).rename('proportion')
             
             # Net Promoter Score approximation (5-star = promoter, 1-2 star = detractor)
-            promoters = len(review_data[review_data['review_score'] == 5])
-            detractors = len(review_data[review_data['review_score'].isin([1, 2])])
-            total_reviews = len(review_data)
+            promoters = int(score_counts.get(5, 0))
+            detractors = int(score_counts.get(1, 0) + score_counts.get(2, 0))
             
             if total_reviews > 0:
                 metrics['nps_score'] = ((promoters - detractors) / total_reviews) * 100
@@ -222,7 +287,7 @@ def analyze_customer_experience(df: pd.DataFrame) -> Dict[str, Any]:
             
             # Delivery category performance
             if 'delivery_category' in df.columns:
-                delivery_performance = delivery_data.groupby('delivery_category').agg({
+                delivery_performance = delivery_data.groupby('delivery_category', observed=True).agg({
                     'review_score': 'mean',
                     'order_id': 'nunique'
                 }).reset_index()
@@ -239,23 +304,26 @@ def calculate_cohort_analysis(df: pd.DataFrame) -> pd.DataFrame:
         df: Sales dataset with customer and date information
         
     Returns:
-        DataFrame with cohort metrics
+        DataFrame with cohort metrics, indexed by first purchase month ('YYYY-MM')
     """
-    # Customer first purchase month
-    customer_cohorts = df.groupby('customer_id')['order_purchase_timestamp'].min().reset_index()
-    customer_cohorts['first_purchase_month'] = customer_cohorts['order_purchase_timestamp'].dt.to_period('M')
-    
-    # Add cohort information back to main dataset
-    df_cohort = df.merge(customer_cohorts[['customer_id', 'first_purchase_month']], on='customer_id')
-    df_cohort['order_month'] = df_cohort['order_purchase_timestamp'].dt.to_period('M')
+    # Customer first purchase timestamp, broadcast back to every order row
+    first_purchase = df.groupby('customer_id', sort=False, observed=True)['order_purchase_timestamp'].transform('min')
+    df_cohort = df.assign(
+        first_purchase_month=first_purchase.dt.to_period('M'),
+        order_month=df['order_purchase_timestamp'].dt.to_period('M')
+    )
     
-    # Calculate period number (months since first purchase)
+    # Calculate period number (months since first purchase) from period ordinals
     df_cohort['period_number'] = (
-        df_cohort['order_month'] - df_cohort['first_purchase_month']
-    ).apply(attrgetter('n'))
+        df_cohort['order_month'].astype('int64') - df_cohort['first_purchase_month'].astype('int64')
+    ).astype('int16')
     
-    # Cohort table
-    cohort_data = df_cohort.groupby(['first_purchase_month', 'period_number'])['customer_id'].nunique().reset_index()
+    if njit is not None and first_purchase.notna().any():
+        return build_cohort_table_numba(df_cohort)
+    
+    # Cohort table (month labels as strings so the pivot index hashes plain strings)
+    cohort_data = df_cohort.groupby(['first_purchase_month', 'period_number'], sort=False, observed=True)['customer_id'].nunique().reset_index()
+    cohort_data['first_purchase_month'] = cohort_data['first_purchase_month'].astype(str)
     cohort_table = cohort_data.pivot(index='first_purchase_month', 
                                    columns='period_number', 
                                    values='customer_id')
@@ -263,14 +331,99 @@ def calculate_cohort_analysis(df: pd.DataFrame) -> pd.DataFrame:
     return cohort_table
 
 
+def count_cohort_customers(sorted_keys: np.ndarray,
+                           n_customers: int,
+                           n_cohorts: int,
+                           n_periods: int) -> np.ndarray:
+    """
+    Count distinct customers per (cohort, period) cell in a single pass.
+    
+    Each key packs a (cohort, period, customer) triple as
+    (cohort * n_periods + period) * n_customers + customer. With the keys
+    sorted, every distinct triple is a contiguous run and is counted once.
+    JIT-compiled with numba when it is installed.
+    
+    Args:
+        sorted_keys: Sorted packed int64 keys
+        n_customers: Number of distinct customer codes
+        n_cohorts: Number of cohort rows in the output
+        n_periods: Number of period columns in the output
+        
+    Returns:
+        Array of shape (n_cohorts, n_periods) with distinct customer counts
+    """
+    counts = np.zeros(n_cohorts * n_periods, np.int64)
+    prev_key = -1
+    
+    for i in range(sorted_keys.shape[0]):
+        if sorted_keys[i] != prev_key:
+            counts[sorted_keys[i] // n_customers] += 1
+            prev_key = sorted_keys[i]
+    
+    return counts.reshape((n_cohorts, n_periods))
+
+
+if njit is not None:
+    count_cohort_customers = njit(cache=True)(count_cohort_customers)
+
+
+def build_cohort_table_numba(df_cohort: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the cohort retention table with the count_cohort_customers kernel.
+    
+    Args:
+        df_cohort: Sales dataset with first_purchase_month and period_number columns
+        
+    Returns:
+        DataFrame with cohort metrics, indexed by first purchase month ('YYYY-MM')
+    """
+    if isinstance(df_cohort['customer_id'].dtype, pd.CategoricalDtype):
+        customer_codes = df_cohort['customer_id'].cat.codes.to_numpy()
+        n_customers = len(df_cohort['customer_id'].cat.categories)
+    else:
+        customer_codes, customers = pd.factorize(df_cohort['customer_id'])
+        n_customers = len(customers)
+    valid = df_cohort['first_purchase_month'].notna().to_numpy() & (customer_codes >= 0)
+    
+    # Integer codes: cohort as months since the first cohort, customers as factor codes
+    cohort_ordinals = df_cohort['first_purchase_month'].astype('int64').to_numpy()[valid]
+    first_ordinal = cohort_ordinals.min()
+    cohort_codes = cohort_ordinals - first_ordinal
+    period_codes = df_cohort['period_number'].to_numpy()[valid].astype(np.int64)
+    customer_codes = customer_codes[valid].astype(np.int64)
+    
+    n_cohorts = int(cohort_codes.max()) + 1
+    n_periods = int(period_codes.max()) + 1
+    
+    # One packed int64 key per row sorts far faster than a three-key lexsort
+    keys = (cohort_codes * n_periods + period_codes) * n_customers + customer_codes
+    counts = count_cohort_customers(np.sort(keys), n_customers, n_cohorts, n_periods)
+    
+    cohort_months = pd.period_range(
+        start=pd.Period(ordinal=first_ordinal, freq='M'), periods=n_cohorts, freq='M'
+    )
+    
+    # Empty cells are NaN and empty cohorts/periods dropped, matching the pivot output
+    cohort_table = pd.DataFrame(
+        np.where(counts > 0, counts, np.nan),
+        index=pd.Index(cohort_months.astype(str), name='first_purchase_month'),
+        columns=pd.Index(range(n_periods), name='period_number')
+    )
+    return cohort_table.dropna(how='all').dropna(axis=1, how='all')
+
+
 def calculate_business_health_score(df: pd.DataFrame, 
-                                  comparison_df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+                                  comparison_df: Optional[pd.DataFrame] = None,
+                                  revenue_metrics: Optional[Dict[str, Any]] = None,
+                                  cx_metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Calculate an overall business health score based on key metrics.
     
     Args:
         df: Primary dataset for analysis
         comparison_df: Optional comparison dataset for growth calculations
+        revenue_metrics: Precomputed calculate_revenue_metrics(df, comparison_df) result (optional)
+        cx_metrics: Precomputed analyze_customer_experience(df) result (optional)
         
     Returns:
         Dictionary containing health score and component metrics
@@ -278,7 +431,8 @@ def calculate_business_health_score(df: pd.DataFrame,
     health_metrics = {}
     
     # Revenue health (30% weight)
-    revenue_metrics = calculate_revenue_metrics(df, comparison_df)
+    if revenue_metrics is None:
+        revenue_metrics = calculate_revenue_metrics(df, comparison_df)
     revenue_score = 70  # Base score
     
     if comparison_df is not None:
@@ -290,7 +444,8 @@ def calculate_business_health_score(df: pd.DataFrame,
     health_metrics['revenue_score'] = min(max(revenue_score, 0), 100)
     
     # Customer experience health (25% weight)
-    cx_metrics = analyze_customer_experience(df)
+    if cx_metrics is None:
+        cx_metrics = analyze_customer_experience(df)
     cx_score = 70  # Base score
     
     if 'avg_review_score' in cx_metrics:
@@ -305,20 +460,15 @@ def calculate_business_health_score(df: pd.DataFrame,
     
     if 'avg_delivery_days' in cx_metrics:
         # Faster delivery = higher score
-        if cx_metrics['avg_delivery_days'] <= 5:
-            ops_score = 90
-        elif cx_metrics['avg_delivery_days'] <= 10:
-            ops_score = 80
-        elif cx_metrics['avg_delivery_days'] <= 15:
-            ops_score = 70
-        else:
-            ops_score = 50
+        ops_score = OPERATIONAL_SCORE_VALUES[
+            np.searchsorted(OPERATIONAL_SCORE_BREAKS, cx_metrics['avg_delivery_days'])
+        ]
     
     health_metrics['operational_score'] = ops_score
     
     # Order fulfillment health (25% weight)
     if 'order_status' in df.columns:
-        delivered_rate = len(df[df['order_status'] == 'delivered']) / len(df)
+        delivered_rate = (df['order_status'].values == 'delivered').mean()
         fulfillment_score = delivered_rate * 100
     else:
         fulfillment_score = 70  # Assume good fulfillment if no status data
@@ -339,6 +489,332 @@ def calculate_business_health_score(df: pd.DataFrame,
     return health_metrics
 
 
+class DashboardMetrics(NamedTuple):
+    """Bundle of all metrics computed for one analysis period and its comparison."""
+    revenue: Dict[str, Any]
+    comparison_revenue: Optional[Dict[str, Any]]
+    customer_experience: Dict[str, Any]
+    product_performance: Dict[str, pd.DataFrame]
+    geographic_performance: Dict[str, pd.DataFrame]
+    monthly_trends: pd.DataFrame
+    comparison_monthly_trends: Optional[pd.DataFrame]
+
+
+def compute_all_metrics(df: pd.DataFrame,
+                        comparison_df: Optional[pd.DataFrame] = None,
+                        comparison_revenue: Optional[Dict[str, Any]] = None,
+                        top_n_categories: int = 10,
+                        top_n_states: int = 10,
+                        comparison_monthly_trends: Optional[pd.DataFrame] = None) -> DashboardMetrics:
+    """
+    Compute every dashboard metric for a period in a single call.
+    
+    The comparison period's revenue metrics are computed once and reused for
+    the growth rates, instead of being recalculated inside
+    calculate_revenue_metrics.
+    
+    Args:
+        df: Primary dataset for analysis
+        comparison_df: Optional comparison dataset
+        comparison_revenue: Precomputed comparison aggregates with at least
+            total_revenue, total_orders and average_order_value (optional,
+            used instead of comparison_df)
+        top_n_categories: Number of top product categories to return
+        top_n_states: Number of top states to return
+        comparison_monthly_trends: Precomputed comparison monthly trends with
+            the calculate_monthly_trends columns (optional, used together
+            with comparison_revenue)
+        
+    Returns:
+        DashboardMetrics with revenue, customer experience, product, geographic
+        and monthly trend results
+    """
+    # Upcast once here; the analyzers' own upcasts are then no-ops
+    df = with_reporting_dtypes(df)
+    
+    if comparison_revenue is None and comparison_df is not None:
+        comparison_revenue = calculate_revenue_metrics(comparison_df)
+        comparison_monthly_trends = calculate_monthly_trends(comparison_df)
+    
+    return DashboardMetrics(
+        revenue=calculate_revenue_metrics(df, comparison_metrics=comparison_revenue),
+        comparison_revenue=comparison_revenue,
+        customer_experience=analyze_customer_experience(df),
+        product_performance=analyze_product_performance(df, top_n=top_n_categories),
+        geographic_performance=analyze_geographic_performance(df, top_n=top_n_states),
+        monthly_trends=calculate_monthly_trends(df),
+        comparison_monthly_trends=comparison_monthly_trends
+    )
+
+
+def to_polars(df: pd.DataFrame) -> 'pl.DataFrame':
+    """
+    Convert a pandas sales dataset to Polars for the *_polars analyzers.
+    
+    Measure columns are upcast as in with_reporting_dtypes, and the delivery
+    category becomes an Enum so it sorts in the pandas category order.
+    
+    Args:
+        df: Sales dataset
+        
+    Returns:
+        Polars DataFrame with the same columns
+    """
+    data = pl.from_pandas(with_reporting_dtypes(df))
+    
+    if 'delivery_category' in df.columns and isinstance(df['delivery_category'].dtype, pd.CategoricalDtype):
+        delivery_categories = df['delivery_category'].cat.categories.tolist()
+        data = data.with_columns(pl.col('delivery_category').cast(pl.Enum(delivery_categories)))
+    
+    return data
+
+
+def calculate_revenue_metrics_polars(data: 'pl.DataFrame',
+                                     comparison_metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Calculate the calculate_revenue_metrics results from a Polars DataFrame.
+    
+    Args:
+        data: Primary dataset for analysis as a Polars DataFrame
+        comparison_metrics: Precomputed revenue metrics for the comparison period (optional)
+        
+    Returns:
+        Dictionary containing revenue metrics and growth rates
+    """
+    order_values = data.group_by('order_id').agg(pl.col('total_revenue').sum())
+    
+    # Both summaries in one row; converting through pandas turns empty-frame nulls into NaN
+    stats = pl.concat([
+        data.select(
+            total_revenue=pl.col('total_revenue').sum(),
+            total_items_sold=pl.len(),
+            average_item_price=pl.col('price').mean()
+        ),
+        order_values.select(
+            total_orders=pl.len(),
+            average_order_value=pl.col('total_revenue').mean(),
+            median_order_value=pl.col('total_revenue').median(),
+            revenue_std=pl.col('total_revenue').std()
+        )
+    ], how='horizontal').to_pandas().iloc[0]
+    
+    metrics = {
+        'total_revenue': stats['total_revenue'],
+        'total_orders': int(stats['total_orders']),
+        'total_items_sold': int(stats['total_items_sold']),
+        'average_order_value': stats['average_order_value'],
+        'average_item_price': stats['average_item_price'],
+        'median_order_value': stats['median_order_value'],
+        'revenue_std': stats['revenue_std']
+    }
+    
+    if comparison_metrics is not None:
+        metrics.update(calculate_growth_rates(metrics, comparison_metrics))
+    
+    return metrics
+
+
+def calculate_monthly_trends_polars(data: 'pl.DataFrame') -> pd.DataFrame:
+    """
+    Calculate the calculate_monthly_trends results from a Polars DataFrame.
+    
+    Args:
+        data: Sales dataset with date columns as a Polars DataFrame
+        
+    Returns:
+        DataFrame with monthly metrics and growth rates
+    """
+    monthly_data = data.group_by('year', 'month').agg(
+        revenue=pl.col('total_revenue').sum(),
+        orders=pl.col('order_id').n_unique().cast(pl.Int64),
+        items_sold=pl.col('order_item_id').count().cast(pl.Int64)
+    ).sort('year', 'month').to_pandas()
+    
+    return add_monthly_growth_rates(monthly_data)
+
+
+def analyze_product_performance_polars(data: 'pl.DataFrame', top_n: int = 10) -> Dict[str, pd.DataFrame]:
+    """
+    Calculate the analyze_product_performance results from a Polars DataFrame.
+    
+    Args:
+        data: Sales dataset with product information as a Polars DataFrame
+        top_n: Number of top categories to return
+        
+    Returns:
+        Dictionary containing various product performance metrics
+    """
+    results = {}
+    
+    # Groups in order of first appearance and stable descending sorts, so ties
+    # are ranked like pandas nlargest
+    category_revenue = data.filter(pl.col('product_category_name').is_not_null()).group_by(
+        'product_category_name', maintain_order=True
+    ).agg(
+        total_revenue=pl.col('total_revenue').sum(),
+        unique_orders=pl.col('order_id').n_unique().cast(pl.Int64),
+        items_sold=pl.col('order_item_id').count().cast(pl.Int64),
+        avg_price=pl.col('price').mean()
+    ).rename({'product_category_name': 'category'})
+    
+    results['category_performance'] = category_revenue.sort(
+        'total_revenue', descending=True, maintain_order=True
+    ).head(top_n).to_pandas()
+    
+    # Product category market share
+    total_revenue = data['total_revenue'].sum()
+    results['market_share'] = category_revenue.select(
+        'category', market_share=pl.col('total_revenue') / total_revenue
+    ).sort('market_share', descending=True, maintain_order=True).head(top_n).to_pandas()
+    
+    # Items per order by category (keyed by product_category_name, as in pandas)
+    results['items_per_order'] = category_revenue.select(
+        product_category_name='category', items_per_order=pl.col('items_sold') / pl.col('unique_orders')
+    ).sort('items_per_order', descending=True, maintain_order=True).head(top_n).to_pandas()
+    
+    return results
+
+
+def analyze_geographic_performance_polars(data: 'pl.DataFrame', top_n: int = 10) -> Dict[str, pd.DataFrame]:
+    """
+    Calculate the analyze_geographic_performance results from a Polars DataFrame.
+    
+    Args:
+        data: Sales dataset with customer geographic information as a Polars DataFrame
+        top_n: Number of top regions to return
+        
+    Returns:
+        Dictionary containing geographic performance metrics
+    """
+    results = {}
+    
+    # State-level analysis
+    state_performance = data.filter(pl.col('customer_state').is_not_null()).group_by(
+        'customer_state', maintain_order=True
+    ).agg(
+        total_revenue=pl.col('total_revenue').sum(),
+        total_orders=pl.col('order_id').n_unique().cast(pl.Int64),
+        unique_customers=pl.col('customer_id').n_unique().cast(pl.Int64),
+        avg_item_price=pl.col('price').mean()
+    ).rename({'customer_state': 'state'}).with_columns(
+        revenue_per_customer=pl.col('total_revenue') / pl.col('unique_customers')
+    )
+    
+    results['state_performance'] = state_performance.sort(
+        'total_revenue', descending=True, maintain_order=True
+    ).head(top_n).to_pandas()
+    
+    # Top states by customer count
+    results['top_customer_states'] = state_performance.sort(
+        'unique_customers', descending=True, maintain_order=True
+    ).head(top_n).select('state', 'unique_customers', 'total_revenue').to_pandas()
+    
+    return results
+
+
+def analyze_customer_experience_polars(data: 'pl.DataFrame') -> Dict[str, Any]:
+    """
+    Calculate the analyze_customer_experience results from a Polars DataFrame.
+    
+    Args:
+        data: Sales dataset with customer experience data as a Polars DataFrame
+        
+    Returns:
+        Dictionary containing customer experience metrics
+    """
+    metrics = {}
+    
+    # Review score analysis
+    if 'review_score' in data.columns:
+        review_scores = data['review_score'].drop_nulls()
+        if review_scores.len() > 0:
+            score_counts = review_scores.value_counts(sort=True)
+            counts = dict(zip(score_counts['review_score'].to_list(), score_counts['count'].to_list()))
+            total_reviews = review_scores.len()
+            
+            metrics['avg_review_score'] = review_scores.mean()
+            metrics['review_score_distribution'] = pd.Series(
+                (score_counts['count'] / total_reviews).to_numpy(),
+                index=pd.Index(score_counts['review_score'].to_numpy(), name='review_score'),
+                name='proportion'
+            )
+            
+            # Net Promoter Score approximation (5-star = promoter, 1-2 star = detractor)
+            promoters = counts.get(5, 0)
+            detractors = counts.get(1, 0) + counts.get(2, 0)
+            metrics['nps_score'] = ((promoters - detractors) / total_reviews) * 100
+    
+    # Delivery performance analysis
+    if 'delivery_days' in data.columns:
+        delivery_data = data.filter(pl.col('delivery_days').is_not_null())
+        if delivery_data.height > 0:
+            metrics['avg_delivery_days'] = delivery_data['delivery_days'].mean()
+            metrics['median_delivery_days'] = delivery_data['delivery_days'].median()
+            
+            # Delivery category performance, in category order (to_polars
+            # makes the column an Enum of the pandas categories)
+            if 'delivery_category' in data.columns:
+                metrics['delivery_satisfaction'] = delivery_data.group_by('delivery_category').agg(
+                    review_score=pl.col('review_score').mean(),
+                    order_id=pl.col('order_id').n_unique().cast(pl.Int64)
+                ).sort('delivery_category').to_pandas()
+    
+    return metrics
+
+
+def compute_all_metrics_polars(df: pd.DataFrame,
+                               comparison_df: Optional[pd.DataFrame] = None,
+                               comparison_revenue: Optional[Dict[str, Any]] = None,
+                               top_n_categories: int = 10,
+                               top_n_states: int = 10,
+                               comparison_monthly_trends: Optional[pd.DataFrame] = None) -> DashboardMetrics:
+    """
+    Compute every dashboard metric for a period with Polars aggregations.
+    
+    The pandas frame is converted to Polars once and every group-by runs
+    there; only the small aggregated results are converted back to pandas,
+    with the same columns as compute_all_metrics. Falls back to
+    compute_all_metrics when Polars is not installed.
+    
+    Args:
+        df: Primary dataset for analysis
+        comparison_df: Optional comparison dataset
+        comparison_revenue: Precomputed comparison aggregates with at least
+            total_revenue, total_orders and average_order_value (optional,
+            used instead of comparison_df)
+        top_n_categories: Number of top product categories to return
+        top_n_states: Number of top states to return
+        comparison_monthly_trends: Precomputed comparison monthly trends with
+            the calculate_monthly_trends columns (optional, used together
+            with comparison_revenue)
+        
+    Returns:
+        DashboardMetrics with revenue, customer experience, product, geographic
+        and monthly trend results
+    """
+    if pl is None:
+        return compute_all_metrics(
+            df, comparison_df, comparison_revenue, top_n_categories, top_n_states, comparison_monthly_trends
+        )
+    
+    data = to_polars(df)
+    
+    if comparison_revenue is None and comparison_df is not None:
+        comparison_data = to_polars(comparison_df)
+        comparison_revenue = calculate_revenue_metrics_polars(comparison_data)
+        comparison_monthly_trends = calculate_monthly_trends_polars(comparison_data)
+    
+    return DashboardMetrics(
+        revenue=calculate_revenue_metrics_polars(data, comparison_revenue),
+        comparison_revenue=comparison_revenue,
+        customer_experience=analyze_customer_experience_polars(data),
+        product_performance=analyze_product_performance_polars(data, top_n=top_n_categories),
+        geographic_performance=analyze_geographic_performance_polars(data, top_n=top_n_states),
+        monthly_trends=calculate_monthly_trends_polars(data),
+        comparison_monthly_trends=comparison_monthly_trends
+    )
+
+
 def generate_executive_summary(df: pd.DataFrame, 
                              comparison_df: Optional[pd.DataFrame] = None,
                              period_label: str = "Analysis Period") -> Dict[str, Any]:
@@ -372,7 +848,9 @@ def generate_executive_summary(df: pd.DataFrame,
     summary.update(cx_metrics)
     
     # Business health
-    health_score = calculate_business_health_score(df, comparison_df)
+    health_score = calculate_business_health_score(
+        df, comparison_df, revenue_metrics=revenue_metrics, cx_metrics=cx_metrics
+    )
     summary['health_score'] = health_score['overall_health_score']
     
     return summary
@@ -416,7 +894,7 @@ def aggregate_by_time_period(df: pd.DataFrame,
         else:
             agg_dict[metric] = 'sum'
     
-    result = df.groupby('period').agg(agg_dict).reset_index()
+    result = with_reporting_dtypes(df).groupby('period', observed=True).agg(agg_dict).reset_index()
     return result
 
 
@@ -461,6 +939,3 @@ def compare_periods(current_df: pd.DataFrame,
     
     return pd.DataFrame(comparison)
 
-
-# Import operator for cohort analysis
-from operator import attrgetter
\ No newline at end of file
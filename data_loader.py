@@ -7,12 +7,87 @@ filtering based on configurable date ranges.
 """
 
 import pandas as pd
-import warnings
+import numpy as np
 from datetime import datetime
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
-# Suppress pandas warnings for cleaner output
-warnings.filterwarnings('ignore', category=pd.errors.SettingWithCopyWarning)
+try:
+    import polars as pl
+except ImportError:  # polars is optional; the pandas pipeline is used instead
+    pl = None
+
+# Copy-on-Write (always on from pandas 3.0) makes filtered frames lazy views
+# and removes the defensive copies behind chained-assignment warnings
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Raw CSV files with the columns consumed downstream and their date columns
+RAW_DATA_FILES = {
+    'orders': (
+        'orders_dataset.csv',
+        ['order_id', 'customer_id', 'order_status',
+         'order_purchase_timestamp', 'order_delivered_customer_date'],
+        ['order_purchase_timestamp', 'order_delivered_customer_date']
+    ),
+    'order_items': (
+        'order_items_dataset.csv',
+        ['order_id', 'order_item_id', 'product_id', 'price', 'freight_value'],
+        None
+    ),
+    'products': (
+        'products_dataset.csv',
+        ['product_id', 'product_category_name'],
+        None
+    ),
+    'customers': (
+        'customers_dataset.csv',
+        ['customer_id', 'customer_state', 'customer_city'],
+        None
+    ),
+    'reviews': (
+        'order_reviews_dataset.csv',
+        ['order_id', 'review_score'],
+        None
+    )
+}
+
+# Explicit dtypes for raw columns, avoiding per-column type inference;
+# order and customer IDs are categorical so nunique runs on integer codes,
+# and the low-cardinality text columns are read straight into dictionary
+# (categorical) arrays instead of being converted after the joins
+RAW_DTYPES = {
+    'order_id': 'category',
+    'customer_id': 'category',
+    'order_item_id': 'int16',
+    'product_id': 'string[pyarrow]',
+    'product_category_name': 'category',
+    'customer_state': 'category',
+    'customer_city': 'category',
+    'order_status': 'category',
+    'price': 'float32',
+    'freight_value': 'float32',
+    'review_score': 'Int8'
+}
+
+# Multi-threaded Arrow CSV reader; faster than the C engine on every raw file
+CSV_ENGINE = 'pyarrow'
+
+# Enriched columns checked for missing values, with their warning labels
+MISSING_DATA_LABELS = {
+    'product_category_name': 'product category',
+    'customer_state': 'customer geography',
+    'review_score': 'review scores',
+    'delivery_days': 'delivery data'
+}
+
+# Columns used as grouping keys that are converted to categorical dtype
+CATEGORICAL_COLUMNS = (
+    'customer_state',
+    'customer_city',
+    'product_category_name',
+    'order_status',
+    'delivery_category'
+)
 
 
 def load_raw_data(data_path: str = 'ecommerce_data/') -> Dict[str, pd.DataFrame]:
@@ -25,13 +100,15 @@ def load_raw_data(data_path: str = 'ecommerce_data/') -> Dict[str, pd.DataFrame]
     Returns:
         Dictionary containing all loaded DataFrames with descriptive keys
     """
-    datasets = {
-        'orders': pd.read_csv(f'{data_path}orders_dataset.csv'),
-        'order_items': pd.read_csv(f'{data_path}order_items_dataset.csv'),
-        'products': pd.read_csv(f'{data_path}products_dataset.csv'),
-        'customers': pd.read_csv(f'{data_path}customers_dataset.csv'),
-        'reviews': pd.read_csv(f'{data_path}order_reviews_dataset.csv')
-    }
+    datasets = {}
+    for name, (file_name, columns, date_columns) in RAW_DATA_FILES.items():
+        datasets[name] = pd.read_csv(
+            f'{data_path}{file_name}',
+            usecols=columns,
+            dtype=RAW_DTYPES,
+            parse_dates=date_columns,
+            engine=CSV_ENGINE
+        )
     
     print(f"Loaded {len(datasets)} datasets:")
     for name, df in datasets.items():
@@ -48,7 +125,7 @@ def prepare_sales_data(datasets: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         datasets: Dictionary containing raw DataFrames
         
     Returns:
-        Merged sales DataFrame with proper date handling
+        Merged sales DataFrame with date components and total revenue
     """
     # Merge order items with order details
     sales_data = pd.merge(
@@ -58,17 +135,15 @@ def prepare_sales_data(datasets: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         on='order_id'
     )
     
-    # Convert timestamps to datetime
-    sales_data['order_purchase_timestamp'] = pd.to_datetime(sales_data['order_purchase_timestamp'])
-    sales_data['order_delivered_customer_date'] = pd.to_datetime(sales_data['order_delivered_customer_date'])
-    
-    # Extract date components
-    sales_data['year'] = sales_data['order_purchase_timestamp'].dt.year
-    sales_data['month'] = sales_data['order_purchase_timestamp'].dt.month
-    sales_data['quarter'] = sales_data['order_purchase_timestamp'].dt.quarter
+    # Extract date components, downcast to the smallest integer types that fit
+    sales_data['year'] = sales_data['order_purchase_timestamp'].dt.year.astype('int16')
+    sales_data['month'] = sales_data['order_purchase_timestamp'].dt.month.astype('int8')
+    sales_data['quarter'] = sales_data['order_purchase_timestamp'].dt.quarter.astype('int8')
     
     # Calculate total revenue (price + freight)
-    sales_data['total_revenue'] = sales_data['price'] + sales_data['freight_value']
+    sales_data['total_revenue'] = (
+        sales_data['price'].to_numpy() + sales_data['freight_value'].to_numpy()
+    ).astype(np.float32, copy=False)
     
     print(f"Created sales dataset: {sales_data.shape[0]:,} records")
     print(f"Date range: {sales_data['order_purchase_timestamp'].min()} to {sales_data['order_purchase_timestamp'].max()}")
@@ -95,7 +170,7 @@ def filter_delivered_orders(sales_data: pd.DataFrame,
         Filtered DataFrame containing only delivered orders
     """
     # Filter for delivered orders
-    filtered_data = sales_data[sales_data['order_status'] == 'delivered'].copy()
+    filtered_data = sales_data[sales_data['order_status'] == 'delivered']
     
     # Apply date filters
     if year is not None:
@@ -124,105 +199,93 @@ def filter_delivered_orders(sales_data: pd.DataFrame,
     return filtered_data
 
 
-def add_product_categories(sales_data: pd.DataFrame, 
-                          products_df: pd.DataFrame) -> pd.DataFrame:
+def add_dimension_data(sales_data: pd.DataFrame,
+                       datasets: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     """
-    Add product category information to sales data.
+    Add product category, customer geography and review score to sales data.
+    
+    Each lookup table is indexed on its key and joined onto the sales data,
+    so the enrichment is a chain of index lookups rather than separate merges.
     
     Args:
         sales_data: Sales DataFrame
-        products_df: Products DataFrame with category information
+        datasets: Dictionary containing the products, customers and reviews DataFrames
         
     Returns:
-        Sales DataFrame enriched with product category data
+        Sales DataFrame enriched with product, geographic and review data
     """
-    enriched_data = pd.merge(
-        left=sales_data,
-        right=products_df[['product_id', 'product_category_name']],
-        on='product_id',
-        how='left'
+    def lookup_table(df: pd.DataFrame, key: str, columns: List[str]) -> pd.DataFrame:
+        # Index on the key with the sales key dtype, so categorical keys
+        # stay categorical through the join instead of decaying to object
+        table = df.set_index(key)[columns]
+        key_dtype = sales_data[key].dtype
+        if isinstance(key_dtype, pd.CategoricalDtype):
+            # Keys outside the sales categories can never match a sales row
+            table = table[table.index.isin(key_dtype.categories)]
+        table.index = table.index.astype(key_dtype)
+        return table
+    
+    products = lookup_table(datasets['products'], 'product_id', ['product_category_name'])
+    customers = lookup_table(datasets['customers'], 'customer_id', ['customer_state', 'customer_city'])
+    reviews = lookup_table(datasets['reviews'], 'order_id', ['review_score'])
+    
+    enriched_data = (
+        sales_data
+        .join(products, on='product_id')
+        .join(customers, on='customer_id')
+        .join(reviews, on='order_id')
     )
     
-    missing_categories = enriched_data['product_category_name'].isna().sum()
-    if missing_categories > 0:
-        print(f"Warning: {missing_categories:,} records missing product category")
-    
     return enriched_data
 
 
-def add_customer_geography(sales_data: pd.DataFrame, 
-                          customers_df: pd.DataFrame) -> pd.DataFrame:
+def add_delivery_metrics(sales_data: pd.DataFrame) -> pd.DataFrame:
     """
-    Add customer geographic information to sales data.
+    Add delivery time in days and a delivery speed category.
     
     Args:
-        sales_data: Sales DataFrame
-        customers_df: Customers DataFrame with geographic information
+        sales_data: Sales DataFrame with purchase and delivery timestamps
         
     Returns:
-        Sales DataFrame enriched with customer location data
+        Sales DataFrame enriched with delivery performance data
     """
-    enriched_data = pd.merge(
-        left=sales_data,
-        right=customers_df[['customer_id', 'customer_state', 'customer_city']],
-        on='customer_id',
-        how='left'
-    )
+    # Calculate delivery speed (undelivered orders propagate NaT to NaN)
+    sales_data['delivery_days'] = (
+        sales_data['order_delivered_customer_date'] - 
+        sales_data['order_purchase_timestamp']
+    ).dt.days.astype('Int16')
     
-    missing_geography = enriched_data['customer_state'].isna().sum()
-    if missing_geography > 0:
-        print(f"Warning: {missing_geography:,} records missing customer geography")
+    # Categorize delivery speed
+    sales_data['delivery_category'] = pd.cut(
+        sales_data['delivery_days'],
+        bins=[-np.inf, 3, 7, np.inf],
+        labels=['1-3 days', '4-7 days', '8+ days']
+    ).cat.add_categories(['Unknown']).fillna('Unknown')
     
-    return enriched_data
+    return sales_data
 
 
-def add_customer_experience_data(sales_data: pd.DataFrame, 
-                                reviews_df: pd.DataFrame) -> pd.DataFrame:
+def finalize_analysis_dataset(enriched_data: pd.DataFrame) -> pd.DataFrame:
     """
-    Add customer experience metrics including reviews and delivery times.
+    Add delivery metrics, report missing values and set categorical key dtypes.
     
     Args:
-        sales_data: Sales DataFrame
-        reviews_df: Reviews DataFrame with customer feedback
+        enriched_data: Sales DataFrame enriched with product, geographic and review data
         
     Returns:
-        Sales DataFrame enriched with customer experience data
+        Analysis-ready DataFrame
     """
-    # Add review scores
-    enriched_data = pd.merge(
-        left=sales_data,
-        right=reviews_df[['order_id', 'review_score']],
-        on='order_id',
-        how='left'
-    )
+    enriched_data = add_delivery_metrics(enriched_data)
     
-    # Calculate delivery speed for delivered orders
-    delivery_mask = enriched_data['order_delivered_customer_date'].notna()
-    enriched_data.loc[delivery_mask, 'delivery_days'] = (
-        enriched_data.loc[delivery_mask, 'order_delivered_customer_date'] - 
-        enriched_data.loc[delivery_mask, 'order_purchase_timestamp']
-    ).dt.days
+    missing_counts = enriched_data[list(MISSING_DATA_LABELS)].isna().sum(axis=0)
+    for column, label in MISSING_DATA_LABELS.items():
+        if missing_counts[column] > 0:
+            print(f"Warning: {missing_counts[column]:,} records missing {label}")
     
-    # Categorize delivery speed
-    def categorize_delivery_speed(days):
-        if pd.isna(days):
-            return 'Unknown'
-        elif days <= 3:
-            return '1-3 days'
-        elif days <= 7:
-            return '4-7 days'
-        else:
-            return '8+ days'
-    
-    enriched_data['delivery_category'] = enriched_data['delivery_days'].apply(categorize_delivery_speed)
-    
-    missing_reviews = enriched_data['review_score'].isna().sum()
-    missing_delivery = enriched_data['delivery_days'].isna().sum()
-    
-    if missing_reviews > 0:
-        print(f"Warning: {missing_reviews:,} records missing review scores")
-    if missing_delivery > 0:
-        print(f"Warning: {missing_delivery:,} records missing delivery data")
+    # Low-cardinality grouping keys are stored as categoricals so downstream
+    # groupbys hash integer codes instead of Python strings
+    for column in CATEGORICAL_COLUMNS:
+        enriched_data[column] = enriched_data[column].astype('category')
     
     return enriched_data
 
@@ -231,7 +294,8 @@ def create_analysis_dataset(data_path: str = 'ecommerce_data/',
                            year: Optional[int] = None,
                            month: Optional[int] = None,
                            start_date: Optional[str] = None,
-                           end_date: Optional[str] = None) -> pd.DataFrame:
+                           end_date: Optional[str] = None,
+                           columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Create a complete analysis-ready dataset with all enrichments and filters.
     
@@ -241,6 +305,7 @@ def create_analysis_dataset(data_path: str = 'ecommerce_data/',
         month: Specific month to filter (optional, requires year)
         start_date: Start date in 'YYYY-MM-DD' format (optional)
         end_date: End date in 'YYYY-MM-DD' format (optional)
+        columns: Columns to keep in the returned DataFrame (optional, all by default)
         
     Returns:
         Complete analysis-ready DataFrame
@@ -259,9 +324,107 @@ def create_analysis_dataset(data_path: str = 'ecommerce_data/',
     
     # Add enrichments
     print("\nEnriching data with additional dimensions...")
-    enriched_data = add_product_categories(filtered_sales, datasets['products'])
-    enriched_data = add_customer_geography(enriched_data, datasets['customers'])
-    enriched_data = add_customer_experience_data(enriched_data, datasets['reviews'])
+    enriched_data = add_dimension_data(filtered_sales, datasets)
+    enriched_data = finalize_analysis_dataset(enriched_data)
+    
+    # Keep only the requested columns so callers never carry unused ones
+    if columns is not None:
+        enriched_data = enriched_data[list(columns)]
+    
+    print(f"\nFinal analysis dataset: {enriched_data.shape[0]:,} records, {enriched_data.shape[1]} columns")
+    print("=" * 50)
+    
+    return enriched_data
+
+
+def create_analysis_dataset_polars(data_path: str = 'ecommerce_data/',
+                                   year: Optional[int] = None,
+                                   month: Optional[int] = None,
+                                   start_date: Optional[str] = None,
+                                   end_date: Optional[str] = None,
+                                   columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Create the analysis-ready dataset with a Polars lazy query.
+    
+    The CSV scans, delivered-order and date filters, and joins are planned as
+    a single lazy query, so filters and column projections are pushed down
+    below the joins. The result has the same rows, column order and dtypes
+    as create_analysis_dataset, except that categorical keys only carry the
+    values present in the result rather than every value in the raw files.
+    Falls back to the pandas pipeline when Polars is not installed.
+    
+    Args:
+        data_path: Path to the directory containing CSV files
+        year: Specific year to filter (optional)
+        month: Specific month to filter (optional, requires year)
+        start_date: Start date in 'YYYY-MM-DD' format (optional)
+        end_date: End date in 'YYYY-MM-DD' format (optional)
+        columns: Columns to keep in the returned DataFrame (optional, all by default)
+        
+    Returns:
+        Complete analysis-ready DataFrame
+    """
+    if pl is None:
+        print("Polars is not installed, using the pandas pipeline")
+        return create_analysis_dataset(data_path, year, month, start_date, end_date, columns)
+    
+    print("Creating analysis dataset (polars lazy query)...")
+    print("=" * 50)
+    
+    # Lazy scans restricted to the consumed columns
+    scans = {}
+    for name, (file_name, usecols, date_columns) in RAW_DATA_FILES.items():
+        scan = pl.scan_csv(f'{data_path}{file_name}').select(usecols)
+        if date_columns:
+            scan = scan.with_columns(pl.col(date_columns).str.to_datetime(time_unit='ns'))
+        scans[name] = scan
+    
+    # Delivered orders in the requested date range, filtered before any join
+    purchase_date = pl.col('order_purchase_timestamp')
+    # Columns in the order prepare_sales_data merges them
+    orders = scans['orders'].filter(pl.col('order_status') == 'delivered').select(
+        'order_id', 'order_status', 'order_purchase_timestamp',
+        'order_delivered_customer_date', 'customer_id'
+    )
+    
+    if year is not None:
+        orders = orders.filter(purchase_date.dt.year() == year)
+        
+    if month is not None and year is not None:
+        orders = orders.filter(purchase_date.dt.month() == month)
+        
+    if start_date is not None:
+        orders = orders.filter(purchase_date >= pd.to_datetime(start_date).to_pydatetime())
+        
+    if end_date is not None:
+        orders = orders.filter(purchase_date <= pd.to_datetime(end_date).to_pydatetime())
+    
+    # Joins keep the order item row order, and revenue is summed in float32
+    # like prepare_sales_data so both pipelines round it identically
+    sales_data = (
+        scans['order_items']
+        .with_columns(pl.col('price', 'freight_value').cast(pl.Float32))
+        .join(orders, on='order_id', how='inner', maintain_order='left')
+        .with_columns(
+            purchase_date.dt.year().cast(pl.Int16).alias('year'),
+            purchase_date.dt.month().cast(pl.Int8).alias('month'),
+            purchase_date.dt.quarter().cast(pl.Int8).alias('quarter'),
+            (pl.col('price') + pl.col('freight_value')).alias('total_revenue')
+        )
+        .join(scans['products'], on='product_id', how='left', maintain_order='left')
+        .join(scans['customers'], on='customer_id', how='left', maintain_order='left')
+        .join(scans['reviews'], on='order_id', how='left', maintain_order='left')
+    )
+    
+    enriched_data = sales_data.collect(engine='streaming').to_pandas()
+    enriched_data = enriched_data.astype(
+        {column: dtype for column, dtype in RAW_DTYPES.items() if column in enriched_data.columns}
+    )
+    enriched_data = finalize_analysis_dataset(enriched_data)
+    
+    # Keep only the requested columns so callers never carry unused ones
+    if columns is not None:
+        enriched_data = enriched_data[list(columns)]
     
     print(f"\nFinal analysis dataset: {enriched_data.shape[0]:,} records, {enriched_data.shape[1]} columns")
     print("=" * 50)
@@ -290,11 +453,16 @@ def get_data_summary(df: pd.DataFrame) -> None:
     if 'order_status' in df.columns:
         print(f"\nOrder Status Distribution:")
         status_counts = df['order_status'].value_counts()
+        status_counts = status_counts[status_counts > 0]
         for status, count in status_counts.items():
             pct = (count / len(df)) * 100
             print(f"  {status}: {count:,} records ({pct:.1f}%)")
     
     if 'total_revenue' in df.columns:
         print(f"\nRevenue Summary:")
-        print(f"  Total Revenue: ${df['total_revenue'].sum():,.2f}")
-        print(f"  Average Order Value: ${df.groupby('order_id')['total_revenue'].sum().mean():.2f}")
\ No newline at end of file
+        # Summed in float64; the float32 column alone cannot hold cent precision at these totals
+        revenue = df['total_revenue'].astype('float64')
+        print(f"  Total Revenue: ${revenue.sum():,.2f}")
+        order_values = revenue.groupby(df['order_id'], sort=False, observed=True).sum()
+        print(f"  Total Orders: {order_values.size:,}")
+        print(f"  Average Order Value: ${order_values.mean():.2f}")
\ No newline at end of file
@@ -1,30 +1,48 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import json
+import os
+import hashlib
+import threading
 
-# Import custom modules
-from data_loader import create_analysis_dataset
-from business_metrics import (
-    calculate_revenue_metrics, 
-    calculate_monthly_trends,
-    analyze_product_performance,
-    analyze_geographic_performance,
-    analyze_customer_experience
-)
+# Raw data location and on-disk Parquet cache for loaded periods
+DATA_PATH = 'ecommerce_data/'
+CACHE_DIR = '.cache'
 
-# Configure page
-st.set_page_config(
-    page_title="E-commerce Analytics Dashboard",
-    page_icon="📊",
-    layout="wide",
-    initial_sidebar_state="collapsed"
-)
+# Part of every Parquet cache key; bump whenever the data_loader output
+# changes (columns, dtypes or row order) so old cache files are not served
+CACHE_SCHEMA_VERSION = 1
+
+# Cache files kept for the current version; the oldest are deleted beyond this
+MAX_CACHE_FILES = 64
+
+# Columns read by compute_all_metrics plus the purchase timestamp the rows
+# are sorted by; everything else is dropped at load time
+ANALYSIS_COLUMNS = [
+    'order_id', 'order_item_id', 'customer_id', 'order_purchase_timestamp',
+    'price', 'total_revenue', 'year', 'month', 'product_category_name',
+    'customer_state', 'review_score', 'delivery_days', 'delivery_category'
+]
+
+# Columns needed to build the daily aggregates
+DAILY_AGGREGATE_COLUMNS = [
+    'order_purchase_timestamp', 'order_id', 'order_item_id',
+    'product_category_name', 'customer_state', 'total_revenue'
+]
+
+# Cached figures kept per chart; each date range selected adds one
+FIGURE_CACHE_ENTRIES = 32
+
+# US state boundaries for the revenue map, with the two-letter state code as
+# each feature id (simplified from the US Census Bureau 2016 cartographic
+# boundary file)
+US_STATES_GEOJSON_PATH = 'assets/us-states.geojson'
 
 # Custom CSS for professional styling with dark theme support
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .metric-card {
         background-color: rgba(255, 255, 255, 0.95);
@@ -110,6 +128,26 @@ st.markdown("""
         margin: 0.5rem 0;
     }
     
+    .kpi-grid, .bottom-grid {
+        display: grid;
+        gap: 1rem;
+    }
+    
+    .kpi-grid {
+        grid-template-columns: repeat(4, minmax(0, 1fr));
+    }
+    
+    .bottom-grid {
+        grid-template-columns: repeat(2, minmax(0, 1fr));
+    }
+    
+    /* Stack the cards on narrow screens, like st.columns does */
+    @media (max-width: 640px) {
+        .kpi-grid, .bottom-grid {
+            grid-template-columns: 1fr;
+        }
+    }
+    
     /* Dark theme specific adjustments */
     @media (prefers-color-scheme: dark) {
         .metric-card, .chart-container, .bottom-card {
@@ -144,31 +182,241 @@ st.markdown("""
         color: #cccccc !important;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Configure page
+st.set_page_config(
+    page_title="E-commerce Analytics Dashboard",
+    page_icon="📊",
+    layout="wide",
+    initial_sidebar_state="collapsed"
+)
+
+@st.cache_resource(show_spinner=False)
+def get_custom_css():
+    """Whitespace-collapsed CUSTOM_CSS, built once per process"""
+    return " ".join(CUSTOM_CSS.split())
+
+@st.cache_resource(show_spinner=False)
+def load_us_states_geojson():
+    """Load and cache the bundled US states GeoJSON, or None if the file is missing"""
+    if not os.path.exists(US_STATES_GEOJSON_PATH):
+        return None
+    
+    with open(US_STATES_GEOJSON_PATH) as geojson_file:
+        return json.load(geojson_file)
+
+def get_data_version():
+    """Modification time of the newest raw CSV, used to invalidate the Parquet caches"""
+    return max(
+        os.path.getmtime(os.path.join(DATA_PATH, name))
+        for name in os.listdir(DATA_PATH) if name.endswith('.csv')
+    )
+
+def get_cache_prefix():
+    """Cache file name prefix for the current cache schema and CSV versions"""
+    key = f"{CACHE_SCHEMA_VERSION}_{get_data_version()}"
+    return hashlib.sha1(key.encode()).hexdigest()[:8]
+
+def get_cache_path(start_date, end_date, columns):
+    """Parquet cache file for a date range and column set, invalidated when the loader or CSVs change"""
+    key = f"{start_date.isoformat()}_{end_date.isoformat()}_{','.join(columns)}"
+    return os.path.join(CACHE_DIR, f"{get_cache_prefix()}_{hashlib.sha1(key.encode()).hexdigest()[:16]}.parquet")
+
+def get_daily_aggregates_path():
+    """Parquet cache file for the daily aggregates, invalidated when the loader or CSVs change"""
+    return os.path.join(CACHE_DIR, f"{get_cache_prefix()}_daily.parquet")
+
+def prune_parquet_cache():
+    """Delete cache files from older versions, and the oldest current ones beyond MAX_CACHE_FILES"""
+    prefix = f"{get_cache_prefix()}_"
+    current_files = []
+    for entry in os.scandir(CACHE_DIR):
+        if not entry.name.endswith('.parquet'):
+            continue
+        if entry.name.startswith(prefix):
+            current_files.append(entry)
+        else:
+            os.remove(entry.path)
+    
+    current_files.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in current_files[MAX_CACHE_FILES:]:
+        os.remove(entry.path)
+
+def write_parquet_cache(data, cache_path):
+    """Write a DataFrame to the Parquet cache, ignoring filesystem errors"""
+    # Write to a temporary file and rename, so readers never see a partial file
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        data.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+        os.replace(tmp_path, cache_path)
+        prune_parquet_cache()
+    except OSError:
+        pass  # Caching is best effort; the data is still returned
+
+def load_period_data(start_date, end_date, columns=ANALYSIS_COLUMNS):
+    """Load one period's analysis dataset, reading the Parquet cache when present"""
+    cache_path = get_cache_path(start_date, end_date, columns)
+    try:
+        return pd.read_parquet(cache_path, engine='pyarrow', columns=columns)
+    except FileNotFoundError:
+        pass  # Not cached yet, or pruned by another session
+    
+    # Imported on first load so the page header renders without waiting for it
+    from data_loader import create_analysis_dataset
+    
+    data = create_analysis_dataset(
+        data_path=DATA_PATH,
+        start_date=start_date.strftime('%Y-%m-%d'),
+        end_date=end_date.strftime('%Y-%m-%d'),
+        columns=columns
+    )
+    
+    # Stored in purchase order, so each month's rows are contiguous for the
+    # monthly groupbys
+    if 'order_purchase_timestamp' in data.columns:
+        data = data.sort_values('order_purchase_timestamp', kind='stable', ignore_index=True)
+    
+    write_parquet_cache(data, cache_path)
+    return data
+
+def build_daily_aggregates():
+    """Per-day revenue, items and orders by category and state over the whole dataset"""
+    cache_path = get_daily_aggregates_path()
+    try:
+        return pd.read_parquet(cache_path, engine='pyarrow')
+    except FileNotFoundError:
+        pass  # Not cached yet, or pruned by another session
+    
+    from data_loader import create_analysis_dataset
+    
+    data = create_analysis_dataset(data_path=DATA_PATH, columns=DAILY_AGGREGATE_COLUMNS)
+    
+    # Each order is counted on its first line item only, so order counts
+    # stay additive when summed across days, categories and states
+    daily_aggregates = data.assign(
+        date=data['order_purchase_timestamp'].dt.normalize(),
+        total_revenue=data['total_revenue'].astype('float64'),
+        first_item=~data['order_id'].duplicated()
+    ).groupby(
+        ['date', 'product_category_name', 'customer_state'], sort=True, observed=True, dropna=False
+    ).agg(
+        revenue=('total_revenue', 'sum'),
+        items_sold=('order_item_id', 'count'),
+        orders=('first_item', 'sum')
+    ).reset_index()
+    
+    write_parquet_cache(daily_aggregates, cache_path)
+    return daily_aggregates
+
+def get_comparison_period(start_date, end_date):
+    """Comparison period of the same length, immediately before the selected one"""
+    period_length = (end_date - start_date).days
+    comparison_end = start_date - timedelta(days=1)
+    comparison_start = comparison_end - timedelta(days=period_length)
+    
+    # Ensure comparison period doesn't go before available data (2016)
+    min_date = datetime(2016, 1, 1).date()
+    if comparison_start < min_date:
+        comparison_start = min_date
+    
+    return comparison_start, comparison_end
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def prefetch_daily_aggregates(data_version):
+    """Build the daily aggregates cache in a background thread (once per data version)"""
+    if os.path.exists(get_daily_aggregates_path()):
+        return None
+    
+    thread = threading.Thread(target=build_daily_aggregates, daemon=True)
+    thread.start()
+    return thread
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_daily_aggregates(data_version):
+    """Load the daily aggregates once per data version, so edited CSVs are picked up"""
+    # Let a still-running prefetch finish instead of building them twice
+    prefetch = prefetch_daily_aggregates(data_version)
+    if prefetch is not None:
+        prefetch.join()
+    
+    return build_daily_aggregates()
+
+@st.cache_data(show_spinner=False)
+def load_comparison_aggregates(start_date, end_date):
+    """Sum the daily aggregates into the comparison-period revenue metrics and monthly trends"""
+    daily_aggregates = load_daily_aggregates(get_data_version())
+    
+    # Whole days from start_date up to, but not including, end_date;
+    # filter_delivered_orders also keeps orders stamped exactly at midnight on end_date
+    dates = daily_aggregates['date']
+    period = daily_aggregates[(dates >= pd.Timestamp(start_date)) & (dates < pd.Timestamp(end_date))]
+    
+    from business_metrics import add_monthly_growth_rates
+    
+    # Same columns as calculate_monthly_trends; each order is counted once,
+    # on its first line item, so summed order counts equal unique orders
+    monthly_trends = add_monthly_growth_rates(period.groupby(
+        [period['date'].dt.year.rename('year'), period['date'].dt.month.rename('month')], sort=True
+    ).agg(
+        revenue=('revenue', 'sum'),
+        orders=('orders', 'sum'),
+        items_sold=('items_sold', 'sum')
+    ).reset_index())
+    
+    total_revenue = period['revenue'].sum()
+    total_orders = int(period['orders'].sum())
+    
+    revenue_metrics = {
+        'total_revenue': total_revenue,
+        'total_orders': total_orders,
+        'average_order_value': total_revenue / total_orders if total_orders > 0 else np.nan
+    }
+    
+    return revenue_metrics, monthly_trends
 
 @st.cache_data
 def load_data(start_date, end_date, comparison_start, comparison_end):
-    """Load and cache data based on date filters"""
+    """Load and cache primary data and comparison aggregates based on date filters"""
     try:
-        # Load primary period data
-        primary_data = create_analysis_dataset(
-            data_path='ecommerce_data/',
-            start_date=start_date.strftime('%Y-%m-%d'),
-            end_date=end_date.strftime('%Y-%m-%d')
-        )
+        # Load the primary period in the background while the comparison
+        # aggregates are computed; the CSV reads release the GIL, so the two
+        # loads overlap
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            primary_future = executor.submit(load_period_data, start_date, end_date, ANALYSIS_COLUMNS)
+            comparison_aggregates = load_comparison_aggregates(comparison_start, comparison_end)
+            primary_data = primary_future.result()
         
-        # Load comparison period data
-        comparison_data = create_analysis_dataset(
-            data_path='ecommerce_data/',
-            start_date=comparison_start.strftime('%Y-%m-%d'),
-            end_date=comparison_end.strftime('%Y-%m-%d')
-        )
-        
-        return primary_data, comparison_data
+        return primary_data, comparison_aggregates
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         return None, None
 
+@st.cache_data(show_spinner=False)
+def load_metrics(start_date, end_date, comparison_start, comparison_end):
+    """Compute and cache all dashboard metrics for ISO-formatted date filters"""
+    primary_data, comparison_aggregates = load_data(
+        date.fromisoformat(start_date), date.fromisoformat(end_date),
+        date.fromisoformat(comparison_start), date.fromisoformat(comparison_end)
+    )
+    
+    if primary_data is None or comparison_aggregates is None:
+        return None
+    
+    from business_metrics import compute_all_metrics_polars
+    
+    comparison_revenue, comparison_monthly_trends = comparison_aggregates
+    
+    # Polars group-bys when installed, otherwise the pandas analyzers
+    return compute_all_metrics_polars(
+        primary_data,
+        comparison_revenue=comparison_revenue,
+        comparison_monthly_trends=comparison_monthly_trends,
+        top_n_categories=10,
+        top_n_states=50  # More states for map
+    )
+
 def format_currency(value):
     """Format currency values"""
     if value >= 1e6:
@@ -187,24 +435,254 @@ def format_number(value):
     else:
         return f"{value:.0f}"
 
+def create_trend_indicators(current_values, previous_values):
+    """Create trend indicator HTML for several KPIs in one vectorized pass"""
+    current = np.asarray(current_values, dtype=float)
+    previous = np.asarray(previous_values, dtype=float)
+    no_previous = previous == 0
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change_pct = np.where(no_previous, 0.0, (current - previous) / previous * 100)
+    
+    arrows = np.where(change_pct > 0, "↗", "↘")
+    color_classes = np.where(change_pct > 0, "trend-up", "trend-down")
+    
+    return [
+        "" if skip else f'<div class="trend-indicator {color_class}">{arrow} {abs(pct):.2f}%</div>'
+        for skip, color_class, arrow, pct in zip(no_previous, color_classes, arrows, change_pct)
+    ]
+
 def create_trend_indicator(current_value, previous_value, format_func=None):
     """Create trend indicator HTML"""
-    if previous_value == 0:
-        return ""
-    
-    change_pct = ((current_value - previous_value) / previous_value) * 100
+    return create_trend_indicators([current_value], [previous_value])[0]
+
+@st.cache_resource(show_spinner=False)
+def configure_plotly_json():
+    """Serialize figures with orjson when available (much faster than stdlib json)"""
+    import plotly.io as pio
     
-    if change_pct > 0:
-        arrow = "↗"
-        color_class = "trend-up"
+    try:
+        import orjson  # noqa: F401
+        pio.json.config.default_engine = "orjson"
+    except ImportError:
+        pass
+
+def frame_hash(data):
+    """Content hash of a DataFrame or Series, used as a figure cache key"""
+    return int(pd.util.hash_pandas_object(data).sum())
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_revenue_fig(monthly_trends_hash, comp_monthly_hash, _monthly_trends, _comp_monthly_trends):
+    """Build and cache the revenue trend figure"""
+    import plotly.graph_objects as go
+    
+    fig_revenue = go.Figure()
+    
+    # Current period line (solid); WebGL traces keep long multi-year ranges responsive
+    fig_revenue.add_trace(go.Scattergl(
+        x=_monthly_trends.index,
+        y=_monthly_trends['revenue'],
+        mode='lines+markers',
+        name='Current Period',
+        line=dict(color='#1f77b4', width=3),
+        marker=dict(size=8)
+    ))
+    
+    # Add previous period if available (dashed)
+    if _comp_monthly_trends is not None and len(_comp_monthly_trends) > 0:
+        fig_revenue.add_trace(go.Scattergl(
+            x=_comp_monthly_trends.index,
+            y=_comp_monthly_trends['revenue'],
+            mode='lines+markers',
+            name='Previous Period',
+            line=dict(color='#ff7f0e', width=2, dash='dash'),
+            marker=dict(size=6)
+        ))
+    
+    fig_revenue.update_layout(
+        title="Revenue Trend",
+        xaxis_title="Month",
+        yaxis_title="Revenue",
+        height=350,
+        showlegend=True,
+        template="plotly_white",
+        xaxis=dict(showgrid=True),
+        yaxis=dict(showgrid=True, tickformat='$,.0s')
+    )
+    
+    return fig_revenue
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_categories_fig(category_performance_hash, _category_performance):
+    """Build and cache the top 10 product categories figure"""
+    import plotly.express as px
+    
+    # Top 10 by revenue, sorted ascending so the largest bar is drawn at the top
+    top_categories = _category_performance.nlargest(10, 'total_revenue').sort_values('total_revenue')
+    
+    fig_categories = px.bar(
+        top_categories,
+        x='total_revenue',
+        y='category',
+        orientation='h',
+        title="Top 10 Product Categories",
+        color='total_revenue',
+        color_continuous_scale='Blues'
+    )
+    
+    fig_categories.update_layout(
+        height=350,
+        template="plotly_white",
+        xaxis_title="Revenue",
+        yaxis_title="",
+        showlegend=False,
+        xaxis=dict(tickformat='$,.0s')
+    )
+    
+    fig_categories.update_traces(
+        texttemplate='%{x:$,.0s}',
+        textposition='outside'
+    )
+    
+    return fig_categories
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_map_fig(state_performance_hash, use_geojson, _state_performance, _states_geojson):
+    """Build and cache the revenue by state map figure"""
+    import plotly.express as px
+    
+    state_data = _state_performance.copy()
+    
+    if use_geojson:
+        # WebGL map with a blank style, so no tiles are fetched
+        fig_map = px.choropleth_map(
+            state_data,
+            geojson=_states_geojson,
+            locations='state',
+            featureidkey='id',
+            color='total_revenue',
+            hover_name='state',
+            map_style='white-bg',
+            center={'lat': 38.5, 'lon': -96.5},
+            zoom=2.3,
+            title='Revenue by State',
+            color_continuous_scale='Blues',
+            labels={'total_revenue': 'Revenue ($)'}
+        )
+        
+        fig_map.update_layout(
+            height=350,
+            template="plotly_white"
+        )
     else:
-        arrow = "↘"
-        color_class = "trend-down"
+        # SVG choropleth with Plotly's built-in state outlines
+        fig_map = px.choropleth(
+            state_data,
+            locations='state',
+            color='total_revenue',
+            locationmode='USA-states',
+            scope='usa',
+            title='Revenue by State',
+            color_continuous_scale='Blues',
+            labels={'total_revenue': 'Revenue ($)'}
+        )
+        
+        fig_map.update_layout(
+            height=350,
+            template="plotly_white",
+            geo=dict(showframe=False, showcoastlines=True)
+        )
     
-    return f'<div class="trend-indicator {color_class}">{arrow} {abs(change_pct):.2f}%</div>'
+    return fig_map
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_delivery_fig(delivery_satisfaction_hash, _delivery_satisfaction):
+    """Build and cache the satisfaction vs delivery time figure"""
+    import plotly.express as px
+    
+    fig_delivery = px.bar(
+        _delivery_satisfaction,
+        x='delivery_category',
+        y='review_score',
+        title="Satisfaction vs Delivery Time",
+        color='review_score',
+        color_continuous_scale='RdYlGn',
+        range_color=[1, 5]
+    )
+    
+    fig_delivery.update_layout(
+        height=350,
+        template="plotly_white",
+        xaxis_title="Delivery Time",
+        yaxis_title="Average Review Score",
+        showlegend=False,
+        yaxis=dict(range=[1, 5])
+    )
+    
+    fig_delivery.update_traces(
+        texttemplate='%{y:.2f}',
+        textposition='outside'
+    )
+    
+    return fig_delivery
+
+def render_revenue_chart(monthly_trends, comp_monthly_trends):
+    """Revenue trend line chart"""
+    if len(monthly_trends) > 0:
+        fig_revenue = build_revenue_fig(
+            frame_hash(monthly_trends),
+            frame_hash(comp_monthly_trends) if comp_monthly_trends is not None else None,
+            monthly_trends, comp_monthly_trends
+        )
+        st.plotly_chart(fig_revenue, use_container_width=True)
+    else:
+        st.info("No monthly trend data available")
+
+def render_categories_chart(product_metrics):
+    """Top 10 categories bar chart"""
+    category_performance = product_metrics['category_performance']
+    if len(category_performance) > 0:
+        fig_categories = build_categories_fig(frame_hash(category_performance), category_performance)
+        st.plotly_chart(fig_categories, use_container_width=True)
+    else:
+        st.info("No product category data available")
+
+def render_map_chart(geo_metrics):
+    """US choropleth map for revenue by state"""
+    state_performance = geo_metrics['state_performance']
+    if len(state_performance) > 0:
+        states_geojson = load_us_states_geojson()
+        fig_map = build_map_fig(
+            frame_hash(state_performance), states_geojson is not None,
+            state_performance, states_geojson
+        )
+        st.plotly_chart(fig_map, use_container_width=True)
+    else:
+        st.info("No geographic data available")
+
+def render_delivery_chart(cx_metrics):
+    """Satisfaction vs delivery time bar chart"""
+    if 'delivery_satisfaction' in cx_metrics and len(cx_metrics['delivery_satisfaction']) > 0:
+        delivery_sat = cx_metrics['delivery_satisfaction']
+        fig_delivery = build_delivery_fig(frame_hash(delivery_sat), delivery_sat)
+        st.plotly_chart(fig_delivery, use_container_width=True)
+    else:
+        # Create dummy data if no delivery satisfaction data
+        st.info("No delivery satisfaction data available")
 
 # Main dashboard
 def main():
+    # Streamlit only keeps elements emitted during the current run, so the
+    # styles are sent on every rerun; the string itself is built once
+    st.markdown(get_custom_css(), unsafe_allow_html=True)
+    
+    # Default date range, shown until the user picks another one
+    default_start = datetime(2022, 1, 1).date()  # January 1, 2022
+    default_end = datetime(2023, 12, 31).date()   # December 31, 2023
+    
+    # Start building the daily aggregates for the comparison period while the page renders
+    prefetch_daily_aggregates(get_data_version())
+    
     # Header with title and date range filter
     col1, col2 = st.columns([2, 1])
     
@@ -213,9 +691,6 @@ def main():
     
     with col2:
         # Date range filter with better defaults
-        default_start = datetime(2022, 1, 1).date()  # January 1, 2022
-        default_end = datetime(2023, 12, 31).date()   # December 31, 2023
-        
         date_range = st.date_input(
             "Select Date Range",
             value=[default_start, default_end],
@@ -229,285 +704,157 @@ def main():
             end_date = default_end
     
     # Calculate comparison period (same length, immediately before)
-    period_length = (end_date - start_date).days
-    comparison_end = start_date - timedelta(days=1)
-    comparison_start = comparison_end - timedelta(days=period_length)
-    
-    # Ensure comparison period doesn't go before available data (2016)
-    min_date = datetime(2016, 1, 1).date()
-    if comparison_start < min_date:
-        comparison_start = min_date
+    comparison_start, comparison_end = get_comparison_period(start_date, end_date)
     
-    # Load data
-    primary_data, comparison_data = load_data(start_date, end_date, comparison_start, comparison_end)
+    # Load data and metrics (cached per date range)
+    metrics = load_metrics(
+        start_date.isoformat(), end_date.isoformat(),
+        comparison_start.isoformat(), comparison_end.isoformat()
+    )
     
-    if primary_data is None or comparison_data is None:
+    if metrics is None:
         st.error("Unable to load data. Please check your data files.")
         return
     
-    # Calculate metrics
-    current_metrics = calculate_revenue_metrics(primary_data, comparison_data)
-    comparison_metrics = calculate_revenue_metrics(comparison_data)
-    cx_metrics = analyze_customer_experience(primary_data)
-    product_metrics = analyze_product_performance(primary_data, top_n=10)
-    geo_metrics = analyze_geographic_performance(primary_data, top_n=50)  # More states for map
-    monthly_trends = calculate_monthly_trends(primary_data)
+    current_metrics = metrics.revenue
+    comparison_metrics = metrics.comparison_revenue
+    cx_metrics = metrics.customer_experience
+    product_metrics = metrics.product_performance
+    geo_metrics = metrics.geographic_performance
+    monthly_trends = metrics.monthly_trends
+    comp_monthly_trends = metrics.comparison_monthly_trends
     
     # KPI Row - 4 cards with trend indicators
     st.markdown("### Key Performance Indicators")
     
-    kpi_col1, kpi_col2, kpi_col3, kpi_col4 = st.columns(4)
-    
-    with kpi_col1:
-        revenue_trend = create_trend_indicator(current_metrics['total_revenue'], comparison_metrics['total_revenue'])
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{format_currency(current_metrics['total_revenue'])}</div>
-            <div class="metric-label">Total Revenue</div>
-            {revenue_trend}
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with kpi_col2:
-        if 'revenue_growth_rate' in current_metrics:
-            growth_rate = current_metrics['revenue_growth_rate'] * 100
-            growth_color = "trend-up" if growth_rate >= 0 else "trend-down"
-            growth_arrow = "↗" if growth_rate >= 0 else "↘"
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{growth_rate:.1f}%</div>
-                <div class="metric-label">Monthly Growth</div>
-                <div class="trend-indicator {growth_color}">{growth_arrow} vs Previous Period</div>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">N/A</div>
-                <div class="metric-label">Monthly Growth</div>
-                <div class="trend-indicator">No comparison data</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with kpi_col3:
-        aov_trend = create_trend_indicator(current_metrics['average_order_value'], comparison_metrics['average_order_value'])
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{format_currency(current_metrics['average_order_value'])}</div>
-            <div class="metric-label">Average Order Value</div>
-            {aov_trend}
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with kpi_col4:
-        orders_trend = create_trend_indicator(current_metrics['total_orders'], comparison_metrics['total_orders'])
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{format_number(current_metrics['total_orders'])}</div>
-            <div class="metric-label">Total Orders</div>
-            {orders_trend}
-        </div>
-        """, unsafe_allow_html=True)
+    # Trend indicators for revenue, AOV and orders, computed in one batch
+    kpi_keys = ['total_revenue', 'average_order_value', 'total_orders']
+    revenue_trend, aov_trend, orders_trend = create_trend_indicators(
+        [current_metrics[key] for key in kpi_keys],
+        [comparison_metrics[key] for key in kpi_keys]
+    )
+    
+    kpi_cards = [
+        f'<div class="metric-card">'
+        f'<div class="metric-value">{format_currency(current_metrics["total_revenue"])}</div>'
+        f'<div class="metric-label">Total Revenue</div>'
+        f'{revenue_trend}'
+        f'</div>'
+    ]
+    
+    if 'revenue_growth_rate' in current_metrics:
+        growth_rate = current_metrics['revenue_growth_rate'] * 100
+        growth_color = "trend-up" if growth_rate >= 0 else "trend-down"
+        growth_arrow = "↗" if growth_rate >= 0 else "↘"
+        kpi_cards.append(
+            f'<div class="metric-card">'
+            f'<div class="metric-value">{growth_rate:.1f}%</div>'
+            f'<div class="metric-label">Monthly Growth</div>'
+            f'<div class="trend-indicator {growth_color}">{growth_arrow} vs Previous Period</div>'
+            f'</div>'
+        )
+    else:
+        kpi_cards.append(
+            '<div class="metric-card">'
+            '<div class="metric-value">N/A</div>'
+            '<div class="metric-label">Monthly Growth</div>'
+            '<div class="trend-indicator">No comparison data</div>'
+            '</div>'
+        )
+    
+    kpi_cards.append(
+        f'<div class="metric-card">'
+        f'<div class="metric-value">{format_currency(current_metrics["average_order_value"])}</div>'
+        f'<div class="metric-label">Average Order Value</div>'
+        f'{aov_trend}'
+        f'</div>'
+    )
+    kpi_cards.append(
+        f'<div class="metric-card">'
+        f'<div class="metric-value">{format_number(current_metrics["total_orders"])}</div>'
+        f'<div class="metric-label">Total Orders</div>'
+        f'{orders_trend}'
+        f'</div>'
+    )
+    
+    # All four cards go out as one element laid out by a CSS grid
+    st.markdown(f'<div class="kpi-grid">{"".join(kpi_cards)}</div>', unsafe_allow_html=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Charts Grid - 2x2 layout
     st.markdown("### Performance Analytics")
+    configure_plotly_json()
     
     chart_col1, chart_col2 = st.columns(2)
     
     with chart_col1:
-        # Revenue trend line chart
-        if len(monthly_trends) > 0:
-            fig_revenue = go.Figure()
-            
-            # Current period line (solid)
-            fig_revenue.add_trace(go.Scatter(
-                x=monthly_trends.index,
-                y=monthly_trends['revenue'],
-                mode='lines+markers',
-                name='Current Period',
-                line=dict(color='#1f77b4', width=3),
-                marker=dict(size=8)
-            ))
-            
-            # Add previous period if available (dashed)
-            if len(comparison_data) > 0:
-                comp_monthly = calculate_monthly_trends(comparison_data)
-                if len(comp_monthly) > 0:
-                    fig_revenue.add_trace(go.Scatter(
-                        x=comp_monthly.index,
-                        y=comp_monthly['revenue'],
-                        mode='lines+markers',
-                        name='Previous Period',
-                        line=dict(color='#ff7f0e', width=2, dash='dash'),
-                        marker=dict(size=6)
-                    ))
-            
-            fig_revenue.update_layout(
-                title="Revenue Trend",
-                xaxis_title="Month",
-                yaxis_title="Revenue",
-                height=350,
-                showlegend=True,
-                template="plotly_white",
-                xaxis=dict(showgrid=True),
-                yaxis=dict(showgrid=True, tickformat='$,.0s')
-            )
-            
-            st.plotly_chart(fig_revenue, use_container_width=True)
-        else:
-            st.info("No monthly trend data available")
+        render_revenue_chart(monthly_trends, comp_monthly_trends)
     
     with chart_col2:
-        # Top 10 categories bar chart
-        if len(product_metrics['category_performance']) > 0:
-            top_categories = product_metrics['category_performance'].head(10).sort_values('total_revenue')
-            
-            fig_categories = px.bar(
-                top_categories,
-                x='total_revenue',
-                y='category',
-                orientation='h',
-                title="Top 10 Product Categories",
-                color='total_revenue',
-                color_continuous_scale='Blues'
-            )
-            
-            fig_categories.update_layout(
-                height=350,
-                template="plotly_white",
-                xaxis_title="Revenue",
-                yaxis_title="",
-                showlegend=False,
-                xaxis=dict(tickformat='$,.0s')
-            )
-            
-            fig_categories.update_traces(
-                texttemplate='%{x:$,.0s}',
-                textposition='outside'
-            )
-            
-            st.plotly_chart(fig_categories, use_container_width=True)
-        else:
-            st.info("No product category data available")
+        render_categories_chart(product_metrics)
     
     chart_col3, chart_col4 = st.columns(2)
     
     with chart_col3:
-        # US choropleth map for revenue by state
-        if len(geo_metrics['state_performance']) > 0:
-            # Create a mapping for state codes (assuming we have state abbreviations)
-            state_data = geo_metrics['state_performance'].copy()
-            
-            fig_map = px.choropleth(
-                state_data,
-                locations='state',
-                color='total_revenue',
-                locationmode='USA-states',
-                scope='usa',
-                title='Revenue by State',
-                color_continuous_scale='Blues',
-                labels={'total_revenue': 'Revenue ($)'}
-            )
-            
-            fig_map.update_layout(
-                height=350,
-                template="plotly_white",
-                geo=dict(showframe=False, showcoastlines=True)
-            )
-            
-            st.plotly_chart(fig_map, use_container_width=True)
-        else:
-            st.info("No geographic data available")
+        render_map_chart(geo_metrics)
     
     with chart_col4:
-        # Satisfaction vs delivery time bar chart
-        if 'delivery_satisfaction' in cx_metrics and len(cx_metrics['delivery_satisfaction']) > 0:
-            delivery_sat = cx_metrics['delivery_satisfaction']
-            
-            fig_delivery = px.bar(
-                delivery_sat,
-                x='delivery_category',
-                y='review_score',
-                title="Satisfaction vs Delivery Time",
-                color='review_score',
-                color_continuous_scale='RdYlGn',
-                range_color=[1, 5]
-            )
-            
-            fig_delivery.update_layout(
-                height=350,
-                template="plotly_white",
-                xaxis_title="Delivery Time",
-                yaxis_title="Average Review Score",
-                showlegend=False,
-                yaxis=dict(range=[1, 5])
-            )
-            
-            fig_delivery.update_traces(
-                texttemplate='%{y:.2f}',
-                textposition='outside'
-            )
-            
-            st.plotly_chart(fig_delivery, use_container_width=True)
-        else:
-            # Create dummy data if no delivery satisfaction data
-            st.info("No delivery satisfaction data available")
+        render_delivery_chart(cx_metrics)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Bottom Row - 2 cards
     st.markdown("### Additional Metrics")
     
-    bottom_col1, bottom_col2 = st.columns(2)
-    
-    with bottom_col1:
-        # Average delivery time with trend
-        if 'avg_delivery_days' in cx_metrics:
-            # Calculate trend (dummy calculation for now)
-            delivery_days = cx_metrics['avg_delivery_days']
-            # Assume 5% improvement for demo
-            prev_delivery = delivery_days * 1.05
-            delivery_trend = create_trend_indicator(delivery_days, prev_delivery)
-            
-            st.markdown(f"""
-            <div class="bottom-card">
-                <div class="metric-value">{delivery_days:.1f} days</div>
-                <div class="metric-label">Average Delivery Time</div>
-                {delivery_trend}
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
-            <div class="bottom-card">
-                <div class="metric-value">N/A</div>
-                <div class="metric-label">Average Delivery Time</div>
-                <div class="trend-indicator">No delivery data</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with bottom_col2:
-        # Review score with stars
-        if 'avg_review_score' in cx_metrics:
-            review_score = cx_metrics['avg_review_score']
-            stars = "⭐" * int(round(review_score))
-            
-            st.markdown(f"""
-            <div class="bottom-card">
-                <div class="metric-value">{review_score:.2f}</div>
-                <div class="review-stars">{stars}</div>
-                <div class="metric-label">Average Review Score</div>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
-            <div class="bottom-card">
-                <div class="metric-value">N/A</div>
-                <div class="review-stars">⭐⭐⭐⭐⭐</div>
-                <div class="metric-label">Average Review Score</div>
-            </div>
-            """, unsafe_allow_html=True)
+    bottom_cards = []
+    
+    # Average delivery time with trend
+    if 'avg_delivery_days' in cx_metrics:
+        # Calculate trend (dummy calculation for now)
+        delivery_days = cx_metrics['avg_delivery_days']
+        # Assume 5% improvement for demo
+        prev_delivery = delivery_days * 1.05
+        delivery_trend = create_trend_indicator(delivery_days, prev_delivery)
+        
+        bottom_cards.append(
+            f'<div class="bottom-card">'
+            f'<div class="metric-value">{delivery_days:.1f} days</div>'
+            f'<div class="metric-label">Average Delivery Time</div>'
+            f'{delivery_trend}'
+            f'</div>'
+        )
+    else:
+        bottom_cards.append(
+            '<div class="bottom-card">'
+            '<div class="metric-value">N/A</div>'
+            '<div class="metric-label">Average Delivery Time</div>'
+            '<div class="trend-indicator">No delivery data</div>'
+            '</div>'
+        )
+    
+    # Review score with stars
+    if 'avg_review_score' in cx_metrics:
+        review_score = cx_metrics['avg_review_score']
+        stars = "⭐" * int(round(review_score))
+        
+        bottom_cards.append(
+            f'<div class="bottom-card">'
+            f'<div class="metric-value">{review_score:.2f}</div>'
+            f'<div class="review-stars">{stars}</div>'
+            f'<div class="metric-label">Average Review Score</div>'
+            f'</div>'
+        )
+    else:
+        bottom_cards.append(
+            '<div class="bottom-card">'
+            '<div class="metric-value">N/A</div>'
+            '<div class="review-stars">⭐⭐⭐⭐⭐</div>'
+            '<div class="metric-label">Average Review Score</div>'
+            '</div>'
+        )
+    
+    st.markdown(f'<div class="bottom-grid">{"".join(bottom_cards)}</div>', unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
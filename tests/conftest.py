@@ -0,0 +1,6 @@
+"""Shared pytest setup: make the repo-root modules importable from tests/."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
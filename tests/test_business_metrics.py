@@ -0,0 +1,73 @@
+"""Parity tests for the Polars metric analyzers against the pandas ones."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_loader import create_analysis_dataset
+from business_metrics import compute_all_metrics, compute_all_metrics_polars
+
+pytest.importorskip('polars')
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'ecommerce_data', '')
+
+# Ranked tables whose ties pandas' nlargest may return in either order
+TIE_SORT_COLUMNS = {
+    'top_customer_states': ['unique_customers', 'state']
+}
+
+
+@pytest.fixture(scope='module')
+def periods():
+    current = create_analysis_dataset(DATA_PATH, start_date='2023-01-01', end_date='2023-12-31')
+    previous = create_analysis_dataset(DATA_PATH, start_date='2022-01-01', end_date='2022-12-31')
+    return current, previous
+
+
+def assert_same_result(expected, actual, path=''):
+    """Recursively compare analyzer results, allowing float rounding differences"""
+    if isinstance(expected, dict):
+        assert set(expected) == set(actual), path
+        for key in expected:
+            assert_same_result(expected[key], actual[key], f'{path}.{key}')
+    elif isinstance(expected, pd.DataFrame):
+        name = path.rsplit('.', 1)[-1]
+        if name in TIE_SORT_COLUMNS:
+            expected = expected.sort_values(TIE_SORT_COLUMNS[name], ascending=[False, True])
+            actual = actual.sort_values(TIE_SORT_COLUMNS[name], ascending=[False, True])
+        pd.testing.assert_frame_equal(
+            expected.reset_index(drop=True), actual.reset_index(drop=True),
+            check_dtype=False, check_categorical=False, rtol=1e-6, obj=path
+        )
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(
+            expected, actual, check_dtype=False, check_index_type=False,
+            rtol=1e-6, obj=path
+        )
+    elif isinstance(expected, (float, np.floating)):
+        assert actual == pytest.approx(expected, rel=1e-6, nan_ok=True), path
+    else:
+        assert expected == actual, path
+
+
+@pytest.mark.parametrize('with_comparison', [False, True])
+def test_polars_metrics_match_pandas(periods, with_comparison):
+    current, previous = periods
+    comparison = previous if with_comparison else None
+    
+    expected = compute_all_metrics(current, comparison)._asdict()
+    actual = compute_all_metrics_polars(current, comparison)._asdict()
+    
+    assert_same_result(expected, actual)
+
+
+def test_polars_delivery_satisfaction_in_category_order(periods):
+    current, _ = periods
+    
+    delivery_satisfaction = compute_all_metrics_polars(current).customer_experience['delivery_satisfaction']
+    
+    delivered = current.loc[current['delivery_days'].notna(), 'delivery_category']
+    observed = [category for category in delivered.cat.categories if category in set(delivered)]
+    assert delivery_satisfaction['delivery_category'].tolist() == observed